@@ -0,0 +1,245 @@
+from io import BytesIO
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from matplotlib.figure import Figure
+
+
+def _fibonacci_terms(n):
+    a, b = 0, 1
+    for _ in range(n):
+        yield a
+        a, b = b, a + b
+
+
+def _compute_fibonacci(n):
+    return np.fromiter(_fibonacci_terms(n), dtype=np.int64, count=n)
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; keep the pure-Python generator
+    pass
+else:
+    # numba cannot compile generators into np.fromiter, so fill the array directly
+    @njit(cache=True)
+    def _compute_fibonacci(n):
+        sequence = np.empty(n, dtype=np.int64)
+        a, b = 0, 1
+        for i in range(n):
+            sequence[i] = a
+            a, b = b, a + b
+        return sequence
+
+
+# Sliders cap at 50 terms, so the whole table fits in int64 and is built once
+# at import, which also pays any JIT compile before the first interaction
+_FIB50 = _compute_fibonacci(51)
+_FIB50.flags.writeable = False  # Shared by every session; refuse in-place edits
+
+
+def generate_fibonacci(n):
+    return _FIB50[:n]
+
+
+def fib_calc(n):
+    return int(_FIB50[n])
+
+
+# Fraction of the way along each 2D arc segment, shared by every segment
+_T = np.linspace(0.0, 1.0, 50)
+
+
+@st.cache_data
+def _trig(n, span):
+    theta = np.linspace(0, span, n)
+    return theta, np.cos(theta), np.sin(theta)
+
+
+@st.cache_data
+def build_2d_png(n_points, show_labels=False):
+    fib = generate_fibonacci(n_points)
+
+    # Create golden spiral coordinates
+    theta, cos_theta, sin_theta = _trig(n_points, 4 * np.pi)  # Reduced rotation for 2D
+    radius = fib * (5.0 / fib[-1])  # Normalized by the largest (last) term and scaled
+
+    x = radius * cos_theta
+    y = radius * sin_theta
+
+    # A bare Figure stays out of pyplot's global state, so concurrent sessions
+    # never share a figure or canvas
+    fig = Figure(figsize=(6, 6))
+    ax = fig.subplots()
+
+    # Plot quarter circles to approximate the spiral, as one NaN-separated line
+    theta_arcs = theta[:-1, None] + np.diff(theta)[:, None] * _T
+    r_arcs = radius[:-1, None] + np.diff(radius)[:, None] * _T
+    gap = np.full((n_points - 1, 1), np.nan)
+    x_arc = np.column_stack([r_arcs * np.cos(theta_arcs), gap]).ravel()
+    y_arc = np.column_stack([r_arcs * np.sin(theta_arcs), gap]).ravel()
+    ax.plot(x_arc, y_arc, 'b-', alpha=0.7, rasterized=True)
+
+    ax.scatter(x, y, c='r', s=50, rasterized=True)
+
+    # Annotate points
+    if show_labels:
+        labels = [(x[i], y[i], f'F{i}={fib[i]}') for i in range(0, n_points, 2)]
+        for lx, ly, label in labels:
+            ax.text(lx, ly, label, fontsize=8, ha='right')
+
+    ax.set_xlim(-5.5, 5.5)
+    ax.set_ylim(-5.5, 5.5)
+    ax.set_aspect('equal')
+    ax.set_title('2D Fibonacci Spiral')
+    ax.grid(True, alpha=0.3)
+
+    # Cache the encoded PNG rather than the mutable Figure; 80 dpi is plenty
+    # for a 6x6 inch inline chart and keeps the image small to encode and send
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=80, bbox_inches='tight')
+    return buf.getvalue()
+
+
+# The 300 smooth points span the same angle and height range for any n_points
+_THETA_SMOOTH_3D = np.linspace(0.0, 8 * np.pi, 300)
+_Z_SMOOTH = np.linspace(0.0, 10.0, 300)
+
+
+@st.cache_data
+def smooth_fib(n_points):
+    # Imported here so sessions that never show the 3D panel skip loading scipy
+    from scipy.interpolate import CubicSpline
+
+    fib = generate_fibonacci(n_points)
+
+    # Create smooth interpolation
+    theta = _trig(n_points, 8 * np.pi)[0]  # Original angles
+    return CubicSpline(theta, fib)(_THETA_SMOOTH_3D)
+
+
+@st.cache_resource
+def build_3d_figure(n_points):
+    fib = generate_fibonacci(n_points)
+
+    _, cos_theta, sin_theta = _trig(n_points, 8 * np.pi)  # Original angles
+    z = np.linspace(0, 10, n_points)  # Original heights
+    fib_smooth = smooth_fib(n_points)
+
+    # Convert to Cartesian coordinates
+    x_smooth = fib_smooth * np.cos(_THETA_SMOOTH_3D)
+    y_smooth = fib_smooth * np.sin(_THETA_SMOOTH_3D)
+    x = fib * cos_theta
+    y = fib * sin_theta
+
+    # Create 3D plot; Plotly renders it with WebGL in the browser
+    fig = go.Figure(data=[
+        # Plot the smooth spiral
+        go.Scatter3d(x=x_smooth, y=y_smooth, z=_Z_SMOOTH, mode='lines',
+                     line=dict(color='blue', width=4), opacity=0.7, name='Smooth Fibonacci Spiral'),
+        # Plot original points
+        go.Scatter3d(x=x, y=y, z=z, mode='markers',
+                     marker=dict(color='red', size=5), name='Fibonacci Points'),
+    ])
+
+    fig.update_layout(
+        title='Smooth 3D Fibonacci Spiral',
+        scene=dict(
+            xaxis_title='X (Fibonacci × cosθ)',
+            yaxis_title='Y (Fibonacci × sinθ)',
+            zaxis_title='Z (Height)',
+        ),
+        height=600,
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+
+    return fig
+
+
+_SESSION_FIGURES_MAX = 20
+
+
+def session_figure(builder, *args):
+    # Small per-session LRU of built figures, kept in its own dict so eviction
+    # never touches other session state such as quiz_started
+    figures = st.session_state.setdefault('figures', {})
+    key = (builder.__name__,) + args
+    if key in figures:
+        figures[key] = figures.pop(key)  # Mark as most recently used
+    else:
+        if len(figures) >= _SESSION_FIGURES_MAX:
+            figures.pop(next(iter(figures)))
+        figures[key] = builder(*args)
+    return figures[key]
+
+
+# Store questions and correct answers
+QUESTIONS = (
+    {
+        "number": 1,
+        "question": "How is each Fibonacci number defined?",
+        "options": ("Previous number + 2", "Sum of two preceding numbers", "Previous number × 1.618", "n² - 1"),
+        "correct": "Sum of two preceding numbers"
+    },
+    {
+        "number": 2,
+        "question": "What are the first two Fibonacci numbers (F₀ and F₁)?",
+        "options": ("0 and 1", "1 and 1", "1 and 2", "2 and 3"),
+        "correct": "0 and 1"
+    },
+    {
+        "number": 3,
+        "question": "What does Fₙ₊₁/Fₙ approach as n increases?",
+        "options": ("π (3.1416...)", "Golden Ratio (1.618...)", "Euler's Number (2.718...)", "√2 (1.414...)"),
+        "correct": "Golden Ratio (1.618...)"
+    },
+    {
+        "number": 4,
+        "question": "Where is the Fibonacci sequence NOT commonly observed?",
+        "options": ("Flower petal counts", "Hurricane spiral patterns", "Atomic electron configurations",
+                    "Pineapple spiral patterns"),
+        "correct": "Atomic electron configurations"
+    },
+    {
+        "number": 5,
+        "question": "What is F₋ₙ in the Fibonacci sequence?",
+        "options": ("Same as Fₙ", "(-1)ⁿ⁺¹Fₙ", "Fₙ/φ", "Undefined"),
+        "correct": "(-1)ⁿ⁺¹Fₙ"
+    },
+    {
+        "number": 6,
+        "question": "What does Binet's formula calculate?",
+        "options": ("Golden ratio approximation", "Exact Fibonacci numbers", "Prime numbers in the sequence",
+                    "Sum of first n Fibonacci numbers"),
+        "correct": "Exact Fibonacci numbers"
+    },
+    {
+        "number": 7,
+        "question": "How do Lucas numbers relate to Fibonacci?",
+        "options": ("Same recurrence with different starting points", "Squares of Fibonacci numbers",
+                    "Every 3rd Fibonacci number", "No relation"),
+        "correct": "Same recurrence with different starting points"
+    },
+    {
+        "number": 8,
+        "question": "What's special about the sum F₁² + F₂² + ... + Fₙ²?",
+        "options": ("Equals Fₙ × Fₙ₊₁", "Always prime", "Forms geometric progression", "Equals φⁿ"),
+        "correct": "Equals Fₙ × Fₙ₊₁"
+    },
+    {
+        "number": 9,
+        "question": "What's true about every 3rd Fibonacci number?",
+        "options": ("Always even", "Always odd", "Always prime", "Always square"),
+        "correct": "Always even"
+    },
+    {
+        "number": 10,
+        "question": "What is gcd(Fₙ, Fₘ)?",
+        "options": ("Fₙ₊ₘ", "F_gcd(n,m)", "gcd(n,m)", "Always 1"),
+        "correct": "F_gcd(n,m)"
+    }
+)
+
+# Next three terms for the Pattern Recognition quiz
+PATTERN_ANSWER = ("13", "21", "34")
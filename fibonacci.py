@@ -1,8 +1,8 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import make_interp_spline
-from mpl_toolkits.mplot3d import Axes3D
+
+from fib_utils import (PATTERN_ANSWER, QUESTIONS, build_2d_png, build_3d_figure, fib_calc, generate_fibonacci,
+                       session_figure)
 
 st.set_page_config(page_title="Fibonacci sequence", page_icon="🌀")
 st.title("🌀 Fibonacci Sequence 🌀")
@@ -45,104 +45,18 @@ if not st.session_state.quiz_started:
     with col1:
         st.subheader("2D Fibonacci Spiral")
 
-
-        def generate_fibonacci(n):
-            sequence = []
-            a, b = 0, 1
-            for _ in range(n):
-                sequence.append(a)
-                a, b = b, a + b
-            return sequence
-
-
+        show_labels = st.checkbox("Show point labels", value=False)
         n_points = st.slider("Number of points for 2D visualization", 5, 50, 10, key="2d_slider")
-        fib = generate_fibonacci(n_points)
-
-        # Create golden spiral coordinates
-        theta = np.linspace(0, 4 * np.pi, n_points)  # Reduced rotation for 2D
-        radius = np.array(fib) / max(fib) * 5  # Normalized and scaled
-
-        x = radius * np.cos(theta)
-        y = radius * np.sin(theta)
-
-        fig, ax = plt.subplots(figsize=(6, 6))
-
-        # Plot quarter circles to approximate the spiral
-        for i in range(n_points - 1):
-            theta_arc = np.linspace(theta[i], theta[i + 1], 50)
-            r = radius[i] + (radius[i + 1] - radius[i]) * (theta_arc - theta[i]) / (theta[i + 1] - theta[i])
-            x_arc = r * np.cos(theta_arc)
-            y_arc = r * np.sin(theta_arc)
-            ax.plot(x_arc, y_arc, 'b-', alpha=0.7)
-
-        ax.scatter(x, y, c='r', s=50)
-
-        # Annotate points
-        for i in range(0, n_points, 2):
-            ax.text(x[i], y[i], f'F{i}={fib[i]}', fontsize=8, ha='right')
-
-        ax.set_xlim(-5.5, 5.5)
-        ax.set_ylim(-5.5, 5.5)
-        ax.set_aspect('equal')
-        ax.set_title('2D Fibonacci Spiral')
-        ax.grid(True, alpha=0.3)
-
-        st.pyplot(fig)
+        st.image(session_figure(build_2d_png, n_points, show_labels))
 
     with col2:
         st.subheader("3D Fibonacci Visualization")
 
-
-        # Generate Fibonacci sequence
-        def generate_fibonacci(n):
-            sequence = []
-            a, b = 0, 1
-            for _ in range(n):
-                sequence.append(a)
-                a, b = b, a + b
-            return sequence
-
-
         n_points = st.slider("Number of points for 3D visualization", 5, 50, 15, key="3d_slider")
-        fib = generate_fibonacci(n_points)
-
-        # Create smooth interpolation
-        theta = np.linspace(0, 8 * np.pi, n_points)  # Original angles
-        z = np.linspace(0, 10, n_points)  # Original heights
-
-        # Create 300 smooth points
-        theta_smooth = np.linspace(theta.min(), theta.max(), 300)
-        fib_smooth = make_interp_spline(theta, fib)(theta_smooth)
-        z_smooth = np.linspace(z.min(), z.max(), 300)
-
-        # Convert to Cartesian coordinates
-        x_smooth = fib_smooth * np.cos(theta_smooth)
-        y_smooth = fib_smooth * np.sin(theta_smooth)
-        x = fib * np.cos(theta)
-        y = fib * np.sin(theta)
-
-        # Create 3D plot
-        fig = plt.figure(figsize=(8, 6))
-        ax = fig.add_subplot(111, projection='3d')
-
-        # Plot the smooth spiral
-        ax.plot(x_smooth, y_smooth, z_smooth, 'b-', linewidth=2, alpha=0.7, label='Smooth Fibonacci Spiral')
+        st.plotly_chart(session_figure(build_3d_figure, n_points))
 
-        # Plot original points
-        ax.scatter(x, y, z, c='r', s=50, label='Fibonacci Points')
-
-        # Label every 3rd point to avoid clutter
-        for i in range(0, n_points, 3):
-            ax.text(x[i], y[i], z[i], f'F{i}={fib[i]}', fontsize=8, color='darkgreen')
-
-        ax.set_xlabel('X (Fibonacci × cosθ)')
-        ax.set_ylabel('Y (Fibonacci × sinθ)')
-        ax.set_zlabel('Z (Height)')
-        ax.set_title('Smooth 3D Fibonacci Spiral')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        st.pyplot(fig)
+        # Label every 3rd point in a table rather than cluttering the 3D view
+        st.dataframe({"n": np.arange(0, n_points, 3), "Fₙ": generate_fibonacci(n_points)[::3]})
 
     # Add interactive calculator
     st.subheader("Fibonacci Calculator")
@@ -150,21 +64,13 @@ if not st.session_state.quiz_started:
 
     fib_sequence = generate_fibonacci(n_terms)
     st.write(f"First {n_terms} Fibonacci numbers:")
-    st.code(", ".join(map(str, fib_sequence)))
+    st.code(np.array2string(fib_sequence, separator=', ', max_line_width=np.inf, formatter={'int': str})[1:-1])
 
     st.subheader("Calculate Fibonacci Numbers")
     col1, col2 = st.columns(2)
     with col1:
         n = st.number_input("Calculate Fₙ where n =", min_value=0, max_value=20, value=5)
 
-
-        def fib_calc(n):
-            a, b = 0, 1
-            for _ in range(n):
-                a, b = b, a + b
-            return a
-
-
         if st.button("Calculate"):
             st.info(f"F_{n} = {fib_calc(n)}")
 
@@ -190,88 +96,24 @@ else:
     if quiz_choice == "Multiple Choice (15 Questions)":
         st.markdown("### Fibonacci Knowledge Test (15 Questions)")
 
-        # Store questions and correct answers
-        questions = [
-            {
-                "number": 1,
-                "question": "How is each Fibonacci number defined?",
-                "options": ["Previous number + 2", "Sum of two preceding numbers", "Previous number × 1.618", "n² - 1"],
-                "correct": "Sum of two preceding numbers"
-            },
-            {
-                "number": 2,
-                "question": "What are the first two Fibonacci numbers (F₀ and F₁)?",
-                "options": ["0 and 1", "1 and 1", "1 and 2", "2 and 3"],
-                "correct": "0 and 1"
-            },
-            {
-                "number": 3,
-                "question": "What does Fₙ₊₁/Fₙ approach as n increases?",
-                "options": ["π (3.1416...)", "Golden Ratio (1.618...)", "Euler's Number (2.718...)", "√2 (1.414...)"],
-                "correct": "Golden Ratio (1.618...)"
-            },
-            {
-                "number": 4,
-                "question": "Where is the Fibonacci sequence NOT commonly observed?",
-                "options": ["Flower petal counts", "Hurricane spiral patterns", "Atomic electron configurations",
-                            "Pineapple spiral patterns"],
-                "correct": "Atomic electron configurations"
-            },
-            {
-                "number": 5,
-                "question": "What is F₋ₙ in the Fibonacci sequence?",
-                "options": ["Same as Fₙ", "(-1)ⁿ⁺¹Fₙ", "Fₙ/φ", "Undefined"],
-                "correct": "(-1)ⁿ⁺¹Fₙ"
-            },
-            {
-                "number": 6,
-                "question": "What does Binet's formula calculate?",
-                "options": ["Golden ratio approximation", "Exact Fibonacci numbers", "Prime numbers in the sequence",
-                            "Sum of first n Fibonacci numbers"],
-                "correct": "Exact Fibonacci numbers"
-            },
-            {
-                "number": 7,
-                "question": "How do Lucas numbers relate to Fibonacci?",
-                "options": ["Same recurrence with different starting points", "Squares of Fibonacci numbers",
-                            "Every 3rd Fibonacci number", "No relation"],
-                "correct": "Same recurrence with different starting points"
-            },
-            {
-                "number": 8,
-                "question": "What's special about the sum F₁² + F₂² + ... + Fₙ²?",
-                "options": ["Equals Fₙ × Fₙ₊₁", "Always prime", "Forms geometric progression", "Equals φⁿ"],
-                "correct": "Equals Fₙ × Fₙ₊₁"
-            },
-            {
-                "number": 9,
-                "question": "What's true about every 3rd Fibonacci number?",
-                "options": ["Always even", "Always odd", "Always prime", "Always square"],
-                "correct": "Always even"
-            },
-            {
-                "number": 10,
-                "question": "What is gcd(Fₙ, Fₘ)?",
-                "options": ["Fₙ₊ₘ", "F_gcd(n,m)", "gcd(n,m)", "Always 1"],
-                "correct": "F_gcd(n,m)"
-            }
-        ]
-
-        # Display questions and collect answers
+        # Display questions and collect answers; the form only reruns on submit
         user_answers = {}
-        for q in questions:
-            st.markdown(f"#### {q['number']}. {q['question']}")
-            user_answers[q['number']] = st.radio(
-                q['question'],
-                q['options'],
-                key=f"q{q['number']}"
-            )
-
-        if st.button("Check Answers"):
+        with st.form("quiz_form"):
+            for q in QUESTIONS:
+                st.markdown(f"#### {q['number']}. {q['question']}")
+                user_answers[q['number']] = st.radio(
+                    q['question'],
+                    q['options'],
+                    key=f"q{q['number']}"
+                )
+
+            submitted = st.form_submit_button("Check Answers")
+
+        if submitted:
             score = 0
             wrong_answers = []
 
-            for q in questions:
+            for q in QUESTIONS:
                 if user_answers[q['number']] == q['correct']:
                     score += 1
                 else:
@@ -317,18 +159,17 @@ else:
         answers = st.text_input("Enter the next three numbers (space separated):")
 
         if answers:
-            user_ans = answers.split()
-            correct_ans = ["13", "21", "34"]
+            user_ans = tuple(answers.split())
 
             if len(user_ans) != 3:
                 st.warning("Please enter exactly 3 numbers")
             else:
-                if user_ans == correct_ans:
+                if user_ans == PATTERN_ANSWER:
                     st.success("Perfect! You recognized the pattern")
                     st.balloons()
                 else:
                     st.error("Almost! Check the sequence again: each number is the sum of the two before it")
-                    st.write(f"Correct answer: {' '.join(correct_ans)}")
+                    st.write(f"Correct answer: {' '.join(PATTERN_ANSWER)}")
 
     # Add a button to return to info
     if st.button("Back to Info"):